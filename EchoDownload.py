@@ -19,6 +19,8 @@ from PyQt6.QtCore import QUrl
 # It needs to be installed: pip install yt-dlp
 import yt_dlp
 
+from records import DownloadJob, DownloadProgress, DownloadResult
+
 # --- Configuration ---
 APP_NAME = "EchoDownload"
 APP_VERSION = "2.6 (UI Refinements)"
@@ -40,8 +42,8 @@ class Downloader(QObject):
     """
     Handles the yt-dlp download process in a separate thread to keep the UI responsive.
     """
-    progress = pyqtSignal(dict)
-    finished = pyqtSignal(dict)
+    progress = pyqtSignal(object)  # DownloadProgress
+    finished = pyqtSignal(object)  # DownloadResult
     error = pyqtSignal(str)
 
     def __init__(self, url, quality_option, download_format, download_path, cookie_file=None):
@@ -57,7 +59,7 @@ class Downloader(QObject):
         """yt-dlp hook to capture download progress."""
         if not self._is_running:
             raise yt_dlp.utils.DownloadError("Download cancelled by user.")
-        self.progress.emit(d)
+        self.progress.emit(DownloadProgress.from_hook(d))
 
     def stop(self):
         """Stops the download process."""
@@ -67,6 +69,7 @@ class Downloader(QObject):
 
     def run(self):
         """Starts the video download."""
+        started_at = time.time()
         try:
             ydl_opts = {
                 'outtmpl': os.path.join(self.download_path, '%(title)s.%(ext)s'),
@@ -111,7 +114,10 @@ class Downloader(QObject):
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info_dict = ydl.extract_info(self.url, download=True)
-                self.finished.emit(info_dict)
+            result = DownloadResult.from_info(info_dict, started_at, time.time())
+            # Drop the raw info_dict (formats, thumbnails, headers...) before crossing threads.
+            del info_dict
+            self.finished.emit(result)
 
         except Exception as e:
             self.error.emit(f"Error: {str(e)}")
@@ -502,13 +508,13 @@ class EchoDownloadApp(QMainWindow):
         else:
             final_path = platform_path
 
-        download_item = {
-            "url": url,
-            "quality": self.quality_combo.currentText(),
-            "format": download_format,
-            "path": final_path,
-            "cookies": self.settings.get('cookie_file')
-        }
+        download_item = DownloadJob(
+            url=url,
+            quality=self.quality_combo.currentText(),
+            download_format=download_format,
+            path=final_path,
+            cookies=self.settings.get('cookie_file')
+        )
         self.download_queue.append(download_item)
         self.url_input.clear()
         self.status_label.setText(f"Added to queue. {len(self.download_queue)} item(s) waiting.")
@@ -523,11 +529,11 @@ class EchoDownloadApp(QMainWindow):
         
         self.current_thread = QThread()
         self.current_downloader = Downloader(
-            url=item["url"],
-            quality_option=item["quality"],
-            download_format=item["format"],
-            download_path=item["path"],
-            cookie_file=item.get("cookies")
+            url=item.url,
+            quality_option=item.quality,
+            download_format=item.download_format,
+            download_path=item.path,
+            cookie_file=item.cookies
         )
         self.current_downloader.moveToThread(self.current_thread)
         
@@ -542,11 +548,11 @@ class EchoDownloadApp(QMainWindow):
         self.cancel_button.setVisible(True)
 
     def update_progress(self, data):
-        if data['status'] == 'downloading':
-            total_bytes = data.get('total_bytes_estimate', data.get('total_bytes', 0))
-            downloaded_bytes = data.get('downloaded_bytes', 0)
-            speed = data.get('speed', 0)
-            eta = data.get('eta', 0)
+        if data.status == 'downloading':
+            total_bytes = data.total_bytes
+            downloaded_bytes = data.downloaded_bytes
+            speed = data.speed
+            eta = data.eta
 
             if total_bytes > 0:
                 percent = (downloaded_bytes / total_bytes) * 100
@@ -555,13 +561,13 @@ class EchoDownloadApp(QMainWindow):
                 eta_str = f"{int(eta)}s" if eta else "N/A"
                 self.status_label.setText(f"Downloading: {int(percent)}% | Speed: {speed_str} | ETA: {eta_str}")
         
-        elif data['status'] == 'finished':
+        elif data.status == 'finished':
             self.status_label.setText("Processing file...")
             self.progress_bar.setValue(100)
 
-    def on_download_finished(self, info):
-        title = info.get('title', 'Unknown Title')
-        platform = info.get('extractor_key', 'Unknown').capitalize()
+    def on_download_finished(self, result):
+        title = result.title
+        platform = result.extractor.capitalize()
         
         if self.settings.get("notifications", True) and self.tray_icon.isVisible():
             self.tray_icon.showMessage("Download Complete", f"'{title}' has finished.",
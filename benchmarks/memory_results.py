@@ -0,0 +1,113 @@
+"""
+Memory benchmark for the compact download records.
+
+Feeds thousands of synthetic, realistically sized yt-dlp info dicts through
+DownloadProgress.from_hook and DownloadResult.from_info the way the app does,
+keeping only what EchoDownloadApp keeps (a capped history of plain dicts),
+and checks that traced memory stays flat between job 1000 and job 5000.
+
+Run from the repository root:  python benchmarks/memory_results.py
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from records import DownloadProgress, DownloadResult  # noqa: E402
+
+TOTAL_JOBS = 5000
+WARMUP_JOBS = 1000
+HISTORY_LIMIT = 12          # mirrors MAX_HISTORY_ITEMS in EchoDownload.py
+MAX_GROWTH_BYTES = 64 * 1024
+PROGRESS_UPDATES = 5
+
+
+def fake_info(i):
+    """Builds an info_dict shaped like a YouTube extraction (a few hundred KB in memory)."""
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                      '(KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Sec-Fetch-Mode': 'navigate',
+    }
+    formats = [{
+        'format_id': f'{i}-{n}',
+        'url': f'https://rr{n % 8}.googlevideo.com/videoplayback?id={i}&itag={n}&' + 'sig=' + 'x' * 400,
+        'ext': 'mp4' if n % 2 else 'webm',
+        'width': 1920, 'height': 1080, 'fps': 30, 'tbr': 2500.0 + n,
+        'filesize': 10_000_000 + n,
+        'http_headers': dict(headers),
+        'fragments': [{'url': f'/frag/{i}/{n}/{k}', 'duration': 5.0} for k in range(8)],
+    } for n in range(120)]
+    thumbnails = [{
+        'url': f'https://i.ytimg.com/vi/{i}/{n}.jpg?' + 'q' * 80,
+        'width': 120 * n, 'height': 90 * n, 'id': str(n),
+    } for n in range(40)]
+    return {
+        'id': f'vid{i:08d}',
+        'title': f'Synthetic video {i}',
+        'extractor_key': 'Youtube',
+        'duration': 300 + i % 60,
+        'description': 'lorem ipsum ' * 200,
+        'formats': formats,
+        'thumbnails': thumbnails,
+        'http_headers': headers,
+        'requested_downloads': [{
+            'filepath': os.path.join('nonexistent', f'Synthetic video {i}.mp4'),
+            'filesize_approx': 42_000_000,
+        }],
+    }
+
+
+def run_job(i, history):
+    """One download as seen by the worker and the UI: build records, drop the dicts."""
+    started_at = time.time()
+    info = fake_info(i)
+    for step in range(PROGRESS_UPDATES):
+        hook = {
+            'status': 'downloading',
+            'downloaded_bytes': step * 1_000_000,
+            'total_bytes': 42_000_000,
+            'speed': 1_500_000.0,
+            'eta': 20,
+            'info_dict': info,
+        }
+        progress = DownloadProgress.from_hook(hook)
+        del hook, progress
+    result = DownloadResult.from_info(info, started_at, time.time())
+    del info
+
+    # EchoDownloadApp.add_to_history
+    history.insert(0, {"title": result.title, "platform": result.extractor.capitalize(), "status": "Completed"})
+    del history[HISTORY_LIMIT:]
+
+
+def main():
+    history = []
+    tracemalloc.start()
+    baseline = None
+    for i in range(1, TOTAL_JOBS + 1):
+        run_job(i, history)
+        if i == WARMUP_JOBS or i == TOTAL_JOBS or i % 1000 == 0:
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+            if i == WARMUP_JOBS:
+                baseline = current
+            print(f"job {i:5d}: current {current / 1024:8.1f} KiB, peak {peak / 1024:8.1f} KiB")
+    growth = current - baseline
+    tracemalloc.stop()
+
+    print(f"growth from job {WARMUP_JOBS} to job {TOTAL_JOBS}: {growth} bytes (limit {MAX_GROWTH_BYTES})")
+    if growth > MAX_GROWTH_BYTES:
+        print("FAIL: memory grew with job count")
+        return 1
+    print("OK: memory stayed flat")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
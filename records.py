@@ -0,0 +1,78 @@
+"""
+Compact records passed between the download worker and the UI.
+
+Kept free of Qt imports so they can be used (and benchmarked) without PyQt6.
+"""
+import os
+
+
+class DownloadJob:
+    """A queued download request."""
+    __slots__ = ("url", "quality", "download_format", "path", "cookies")
+
+    def __init__(self, url, quality, download_format, path, cookies=None):
+        self.url = url
+        self.quality = quality
+        self.download_format = download_format
+        self.path = path
+        self.cookies = cookies
+
+
+class DownloadProgress:
+    """The handful of progress fields the UI displays, copied out of a yt-dlp hook dict."""
+    __slots__ = ("status", "downloaded_bytes", "total_bytes", "speed", "eta")
+
+    def __init__(self, status, downloaded_bytes=0, total_bytes=0, speed=None, eta=None):
+        self.status = status
+        self.downloaded_bytes = downloaded_bytes
+        self.total_bytes = total_bytes
+        self.speed = speed
+        self.eta = eta
+
+    @classmethod
+    def from_hook(cls, d):
+        # The hook dict carries a reference to the full info_dict; never let it leave the worker.
+        return cls(
+            status=d.get('status'),
+            downloaded_bytes=d.get('downloaded_bytes') or 0,
+            total_bytes=d.get('total_bytes') or d.get('total_bytes_estimate') or 0,
+            speed=d.get('speed'),
+            eta=d.get('eta'),
+        )
+
+
+class DownloadResult:
+    """Summary of a finished download, extracted from the yt-dlp info_dict."""
+    __slots__ = ("title", "video_id", "extractor", "filepath", "filesize",
+                 "duration", "started_at", "finished_at")
+
+    def __init__(self, title, video_id, extractor, filepath, filesize,
+                 duration, started_at, finished_at):
+        self.title = title
+        self.video_id = video_id
+        self.extractor = extractor
+        self.filepath = filepath
+        self.filesize = filesize
+        self.duration = duration
+        self.started_at = started_at
+        self.finished_at = finished_at
+
+    @classmethod
+    def from_info(cls, info, started_at, finished_at):
+        """Copies only the fields we use so the raw info_dict can be released."""
+        downloads = info.get('requested_downloads') or []
+        filepath = (downloads[-1].get('filepath') if downloads else None) or info.get('filepath') or info.get('_filename')
+        if filepath and os.path.exists(filepath):
+            filesize = os.path.getsize(filepath)
+        else:
+            filesize = info.get('filesize') or info.get('filesize_approx')
+        return cls(
+            title=info.get('title') or 'Unknown Title',
+            video_id=info.get('id'),
+            extractor=info.get('extractor_key') or 'Unknown',
+            filepath=filepath,
+            filesize=filesize,
+            duration=info.get('duration'),
+            started_at=started_at,
+            finished_at=finished_at,
+        )